@@ -5,14 +5,16 @@ Flow:
 1. User sends message
 2. Retrieve relevant chunks from ChromaDB  
 3. Pass context + system prompt + conversation history to LLM
-4. LLM responds naturally and calls lead_capture tool when ready
+4. LLM streams its response and calls lead_capture tool when ready
 5. Show both tool result AND LLM's text response to user
 """
 
+import asyncio
 import sys
 import os
 import json
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Optional, Dict, Any, List
 
 # Ensure project root is on sys.path so `src` package imports work
 # when the file is executed directly (e.g. `chainlit run src/app.py`).
@@ -22,19 +24,221 @@ if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 import chainlit as cl
-from langchain_openai import ChatOpenAI
-from langchain_core.messages import HumanMessage, SystemMessage, AIMessage, ToolMessage
+from langchain_core.messages import (
+    HumanMessage, SystemMessage, AIMessage, AIMessageChunk, ToolMessage, trim_messages
+)
 
 from src.config.settings import get_settings
+from src.services.llm_clients import count_message_tokens, get_llm
+from src.services.response_cache import SemanticResponseCache
 from src.services.vector_store import VectorStoreManager
-from src.utils.prompt_loader import PromptLoader
+from src.utils.prompt_loader import get_prompt_loader
 from src.tools.lead_capture import lead_capture_tool
+from src.models import IntentType
+from src.utils.intent import detect_intent_fast, is_self_identifying
 
 
 # Initialize services
 settings = get_settings()
+
 vector_store_manager = VectorStoreManager()
-prompt_loader = PromptLoader()
+prompt_loader = get_prompt_loader()
+response_cache = SemanticResponseCache(
+    threshold=settings.response_cache_threshold,
+    max_entries=settings.response_cache_size
+)
+
+# Background warm-up started at app startup (reference kept so it isn't garbage collected)
+warm_up_task: Optional[asyncio.Task] = None
+
+# Tools available to the agent, keyed by name for direct dispatch of tool calls
+TOOLS = {tool.name: tool for tool in [lead_capture_tool]}
+
+# Intents whose turns are answered without knowledge base context
+SKIP_RETRIEVAL_INTENTS = {IntentType.CASUAL_GREETING, IntentType.HIGH_INTENT_LEAD}
+
+
+@lru_cache(maxsize=1)
+def get_agent_llm():
+    """
+    Get the tool-enabled chat model, built once and shared by all sessions.
+    
+    Returns:
+        ChatOpenAI runnable with lead_capture_tool bound
+    """
+    return get_llm().bind_tools(list(TOOLS.values()))
+
+
+@lru_cache(maxsize=1)
+def get_system_message() -> SystemMessage:
+    """
+    Get the rendered system prompt, built once and shared by all sessions.
+    
+    Reusing one message keeps the prompt prefix byte-identical across
+    turns and sessions, which maximizes provider-side prompt cache hits.
+    
+    Returns:
+        SystemMessage containing the rendered system prompt
+    """
+    return SystemMessage(content=prompt_loader.render("system_prompt.md"))
+
+
+def build_user_message(query: str, context: str) -> str:
+    """
+    Build the user turn sent to the LLM, combining query and retrieved context.
+    
+    Args:
+        query: Raw user message
+        context: Retrieved knowledge base context
+        
+    Returns:
+        Formatted message content
+    """
+    # Leave out the knowledge base section entirely when retrieval was skipped
+    if not context:
+        return f"""User Query: {query}
+
+Respond to the user naturally. If the user is ready to sign up and you have their name, email, and platform, call the lead_capture tool."""
+    
+    return f"""User Query: {query}
+
+Relevant Knowledge Base Context:
+{context}
+
+Answer the user's query naturally using the context provided. If the user is ready to sign up and you have their name, email, and platform, call the lead_capture tool."""
+
+
+async def embed_query(query: str, needed: bool) -> Optional[List[float]]:
+    """
+    Embed a user message once for both the response cache and retrieval.
+    
+    Args:
+        query: Raw user message
+        needed: Whether anything in this turn uses the embedding
+        
+    Returns:
+        Query embedding, or None when it isn't needed
+    """
+    if not needed:
+        return None
+    return await vector_store_manager.embedding_service.aembed_query(query)
+
+
+async def retrieve_context(query: str, query_embedding: Optional[List[float]] = None) -> str:
+    """
+    Retrieve knowledge base context for a user message.
+    
+    Args:
+        query: Raw user message
+        query_embedding: Precomputed embedding of the message, if available
+        
+    Returns:
+        Formatted context string
+    """
+    docs = await vector_store_manager.amax_marginal_relevance_search(
+        query, k=4, embedding=query_embedding
+    )
+    return vector_store_manager.format_context(docs)
+
+
+def is_cacheable_turn(
+    query: str, 
+    conversation_history: list, 
+    fast_intent: Optional[IntentType]
+) -> bool:
+    """
+    Decide whether a turn may use the response cache.
+    
+    The cache is shared by all sessions (though only identical query text
+    hits across sessions), so it is limited to turns without obviously
+    user-specific content: the query must not identify the user (email or
+    self-introduction such as "my name is ..."), must not be lead details,
+    and the history must not contain an earlier tool call (whose result is
+    personal). Answers that call a tool are never stored either.
+    
+    Args:
+        query: Raw user message
+        conversation_history: Messages from previous turns
+        fast_intent: Result of detect_intent_fast for the query
+        
+    Returns:
+        True if the answer may be looked up in and stored to the cache
+    """
+    return (
+        settings.response_cache_size > 0
+        and not is_self_identifying(query)
+        and fast_intent is not IntentType.HIGH_INTENT_LEAD
+        and not any(isinstance(msg, ToolMessage) for msg in conversation_history)
+    )
+
+
+def trim_history(conversation_history: list) -> list:
+    """
+    Keep conversation history within the token budget.
+    
+    History is left untouched until it exceeds the budget and is then cut
+    down to half of it, so the system prompt + history prefix stays
+    byte-identical across most turns and OpenAI's automatic prompt
+    caching keeps hitting. Oldest turns are dropped first, and the result
+    starts on a user message so tool call/result pairs are never split.
+    
+    Args:
+        conversation_history: Messages from previous turns
+        
+    Returns:
+        Trimmed list of messages
+    """
+    if count_message_tokens(conversation_history) <= settings.max_history_tokens:
+        return conversation_history
+    
+    return trim_messages(
+        conversation_history,
+        max_tokens=settings.max_history_tokens // 2,
+        token_counter=count_message_tokens,
+        strategy="last",
+        start_on="human"
+    )
+
+
+async def stream_response(llm, messages: list, reply: cl.Message) -> AIMessageChunk:
+    """
+    Stream an LLM response into a Chainlit message.
+    
+    Text tokens are pushed to the UI as they arrive while the chunks are
+    aggregated, so tool calls are available once the stream completes.
+    
+    Args:
+        llm: Chat model (with tools bound)
+        messages: Messages to send to the model
+        reply: Chainlit message receiving the streamed tokens
+        
+    Returns:
+        Aggregated response chunk including any tool calls
+    """
+    response = AIMessageChunk(content="")
+    async for chunk in llm.astream(messages):
+        if chunk.content:
+            await reply.stream_token(chunk.content)
+        response += chunk
+    return response
+
+
+async def warm_up() -> None:
+    """Load the vector store and system prompt, logging instead of raising on failure"""
+    try:
+        await asyncio.gather(
+            asyncio.to_thread(vector_store_manager.get_vector_store),
+            asyncio.to_thread(get_system_message)
+        )
+    except Exception as e:
+        print(f"Warm-up failed (will retry on first chat): {e}")
+
+
+@cl.on_app_startup
+async def startup():
+    """Start warming shared resources in the background when the server boots"""
+    global warm_up_task
+    warm_up_task = asyncio.create_task(warm_up())
 
 
 @cl.on_chat_start
@@ -44,23 +248,19 @@ async def start():
     await cl.Message(content="🎬 **Initializing AutoStream AI Assistant...**").send()
     
     try:
-        # Initialize vector store
-        vector_store = vector_store_manager.initialize_vector_store()
-        
-        # Initialize LLM with tool calling
-        llm = ChatOpenAI(
-            model=settings.model_name,
-            temperature=0.7,
-            api_key=settings.openai_api_key
-        ).bind_tools([lead_capture_tool])
+        # Load vector store (once per process) and system prompt concurrently,
+        # off the event loop so other sessions aren't blocked
+        vector_store, _ = await asyncio.gather(
+            asyncio.to_thread(vector_store_manager.get_vector_store),
+            asyncio.to_thread(get_system_message)
+        )
         
-        # Load system prompt
-        system_prompt = prompt_loader.load_prompt("system_prompt.md")
+        # Shared LLM with tool calling
+        llm = get_agent_llm()
         
         # Store in session
         cl.user_session.set("vector_store", vector_store)
         cl.user_session.set("llm", llm)
-        cl.user_session.set("system_prompt", system_prompt)
         cl.user_session.set("conversation_history", [])
         
         await cl.Message(
@@ -88,47 +288,66 @@ async def main(message: cl.Message):
     # Get session data
     vector_store = cl.user_session.get("vector_store")
     llm = cl.user_session.get("llm")
-    system_prompt = cl.user_session.get("system_prompt")
     conversation_history = cl.user_session.get("conversation_history", [])
     
     if not llm or not vector_store:
         await cl.Message(content="Please refresh the page to restart.").send()
         return
     
-    # Step 1: Retrieve relevant context from ChromaDB
-    docs = vector_store.similarity_search(message.content, k=4)
-    context = "\n\n".join([doc.page_content for doc in docs])
-    
-    # Step 2: Build messages for LLM
-    messages = [SystemMessage(content=system_prompt)]
-    
-    # Add conversation history
-    messages.extend(conversation_history)
-    
-    # Add current message with context
-    user_message_with_context = f"""User Query: {message.content}
-
-Relevant Knowledge Base Context:
-{context}
-
-Answer the user's query naturally using the context provided. If the user is ready to sign up and you have their name, email, and platform, call the lead_capture tool."""
-    
-    messages.append(HumanMessage(content=user_message_with_context))
-    
-    # Step 3: Get LLM response
     try:
-        response = await llm.ainvoke(messages)
+        # Step 0: Embed the query (shared by the response cache and retrieval)
+        # while trimming history
+        # Greetings and bare platform names resolved by the local fast path don't
+        # need the knowledge base, so retrieval is skipped for them
+        fast_intent = detect_intent_fast(message.content)
+        needs_retrieval = fast_intent not in SKIP_RETRIEVAL_INTENTS
+        cacheable = is_cacheable_turn(message.content, conversation_history, fast_intent)
+        session_id = cl.user_session.get("id")
+        history_key = response_cache.history_key(conversation_history)
+        query_embedding, conversation_history = await asyncio.gather(
+            embed_query(message.content, cacheable or needs_retrieval),
+            asyncio.to_thread(trim_history, conversation_history)
+        )
+        
+        # Answer from the response cache when the same query was already answered
+        # in the same conversational state (or a similar one, in this session)
+        if cacheable:
+            cached_response = response_cache.lookup(
+                session_id, history_key, message.content, query_embedding
+            )
+            if cached_response is not None:
+                reply = cl.Message(content="")
+                await reply.stream_token(cached_response)
+                conversation_history.append(HumanMessage(content=message.content))
+                conversation_history.append(AIMessage(content=cached_response))
+                cl.user_session.set("conversation_history", conversation_history)
+                await reply.send()
+                return
+        
+        # Step 1: Retrieve relevant context from ChromaDB
+        context = await retrieve_context(message.content, query_embedding) if needs_retrieval else ""
         
-        # Extract text content for display
-        response_text = response.content if response.content else ""
+        # Step 2: Build messages for LLM
+        messages = [get_system_message()]
         
-        # Step 4: Handle tool calls if present
+        # Add conversation history
+        messages.extend(conversation_history)
+        
+        # Add current message with context
+        messages.append(HumanMessage(content=build_user_message(message.content, context)))
+        
+        # Step 3: Stream LLM response to the user as tokens arrive
+        reply = cl.Message(content="")
+        response = await stream_response(llm, messages, reply)
+        
+        # Step 4: Handle tool calls if present (collected from the aggregated stream)
         if response.tool_calls:
             for tool_call in response.tool_calls:
-                if tool_call["name"] == "lead_capture_tool":
-                    # Execute the tool
+                tool = TOOLS.get(tool_call["name"])
+                if tool is not None:
+                    # Execute the tool off the event loop (Resend email is a network call)
                     args = tool_call["args"]
-                    tool_result = lead_capture_tool.invoke(args)
+                    tool_result = await tool.ainvoke(args)
                     
                     # Add tool call and result to messages
                     messages.append(response)
@@ -137,9 +356,10 @@ Answer the user's query naturally using the context provided. If the user is rea
                         tool_call_id=tool_call["id"]
                     ))
                     
-                    # Get final response from LLM after tool execution
-                    final_response = await llm.ainvoke(messages)
-                    response_text = final_response.content
+                    # Stream final response from LLM after tool execution
+                    if reply.content:
+                        await reply.stream_token("\n\n")
+                    final_response = await stream_response(llm, messages, reply)
                     
                     # Update conversation history with tool interaction
                     conversation_history.append(HumanMessage(content=message.content))
@@ -155,15 +375,16 @@ Answer the user's query naturally using the context provided. If the user is rea
             # No tool calls, just regular response
             conversation_history.append(HumanMessage(content=message.content))
             conversation_history.append(response)
-        
-        # Keep conversation history manageable (last 10 messages)
-        if len(conversation_history) > 10:
-            conversation_history = conversation_history[-10:]
+            
+            if cacheable:
+                response_cache.store(
+                    session_id, history_key, message.content, query_embedding, response.content
+                )
         
         cl.user_session.set("conversation_history", conversation_history)
         
-        # Step 5: Send response to user
-        await cl.Message(content=response_text).send()
+        # Step 5: Finalize the streamed response
+        await reply.send()
         
     except Exception as e:
         print(f"Error: {e}")
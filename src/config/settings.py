@@ -31,12 +31,44 @@ class Settings(BaseSettings):
         description="OpenAI model to use for the agent"
     )
     
+    max_history_tokens: int = Field(
+        default=2000,
+        description="Token budget for conversation history sent to the LLM"
+    )
+    
     # ChromaDB Configuration
     chroma_db_path: str = Field(
         default="./data/chroma_db",
         description="Path to ChromaDB persistent storage"
     )
     
+    # Embedding Cache Configuration
+    embedding_cache_path: str = Field(
+        default="./data/embedding_cache",
+        description="Directory for cached embedding vectors (empty to disable)"
+    )
+    
+    retrieval_fetch_k: int = Field(
+        default=20,
+        description="Candidate pool size reranked with MMR during retrieval"
+    )
+    
+    max_context_chars: int = Field(
+        default=4000,
+        description="Character budget for retrieved context passed to the LLM"
+    )
+    
+    # Response Cache Configuration
+    response_cache_size: int = Field(
+        default=256,
+        description="Maximum cached agent responses (0 to disable)"
+    )
+    
+    response_cache_threshold: float = Field(
+        default=0.95,
+        description="Cosine similarity required to reuse a cached response within a session"
+    )
+    
     # Knowledge Base Configuration
     knowledge_base_path: str = Field(
         default="./knowledge_base",
@@ -90,7 +122,7 @@ class Settings(BaseSettings):
             raise ValueError("OpenAI API key cannot be empty")
         return v
     
-    @field_validator("chroma_db_path", "knowledge_base_path", "prompts_path")
+    @field_validator("chroma_db_path", "embedding_cache_path", "knowledge_base_path", "prompts_path")
     @classmethod
     def validate_path(cls, v: str) -> str:
         """Ensure paths use forward slashes for consistency."""
@@ -3,11 +3,39 @@ Pydantic Models for AutoStream AI Agent
 Defines data structures for intent classification, lead capture, and user interactions.
 """
 
+import time
 from enum import Enum
 from typing import Optional, List
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, ConfigDict, Field, EmailStr, field_serializer, field_validator
 from datetime import datetime
 
+from src.utils.patterns import EMAIL_PLAIN_CHARS_RE, EMAIL_PREFILTER_RE
+
+
+def check_email_shape(value):
+    """Reject structurally invalid emails before the heavier EmailStr validation"""
+    if not isinstance(value, str):
+        return value
+    address = value.strip()
+    # Display-name forms ("John Doe <john@example.com>") are left to EmailStr
+    if "@" not in address or (
+        EMAIL_PLAIN_CHARS_RE.fullmatch(address) and not EMAIL_PREFILTER_RE.match(address)
+    ):
+        raise ValueError("value is not a valid email address")
+    return value
+
+
+def parse_timestamp(value):
+    """Accept datetimes and ISO-8601 strings (as produced in JSON mode) as epoch seconds"""
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return value
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return value
+
 
 class IntentType(str, Enum):
     """User intent classification categories"""
@@ -25,8 +53,7 @@ class UserIntent(BaseModel):
     confidence: float = Field(ge=0.0, le=1.0, description="Confidence score between 0 and 1")
     reasoning: Optional[str] = Field(None, description="Explanation for the classification")
     
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
 
 
 class LeadData(BaseModel):
@@ -36,26 +63,74 @@ class LeadData(BaseModel):
     company: Optional[str] = None
     phone: Optional[str] = None
     plan_interest: Optional[str] = Field(None, description="Basic or Pro plan")
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: float = Field(default_factory=time.time, description="Unix epoch seconds")
     conversation_context: Optional[str] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "email": "creator@example.com",
                 "name": "John Doe",
                 "plan_interest": "Pro",
-                "timestamp": "2026-01-14T10:30:00"
+                "timestamp": 1768386600.0
             }
         }
+    )
+    
+    @field_validator("email", mode="before")
+    @classmethod
+    def prefilter_email(cls, v):
+        """Fail fast on obviously invalid emails"""
+        return check_email_shape(v)
+    
+    @field_validator("timestamp", mode="before")
+    @classmethod
+    def coerce_timestamp(cls, v):
+        """Convert datetime and ISO-8601 input to epoch seconds"""
+        return parse_timestamp(v)
+    
+    @field_serializer("timestamp", when_used="json")
+    def serialize_timestamp(self, value: float) -> str:
+        """Serialize the epoch timestamp as local ISO-8601"""
+        return datetime.fromtimestamp(value).isoformat()
+
+
+class LeadCaptureInput(BaseModel):
+    """Validated arguments for the lead_capture tool"""
+    name: str = Field(..., min_length=2, description="Lead's full name")
+    email: EmailStr = Field(..., description="Lead's email address")
+    platform: str = Field(..., min_length=1, description="Content creation platform (YouTube, Instagram, TikTok, X, etc.)")
+    
+    @field_validator("email", mode="before")
+    @classmethod
+    def prefilter_email(cls, v):
+        """Fail fast on obviously invalid emails"""
+        return check_email_shape(v)
+    
+    @field_validator("platform", mode="before")
+    @classmethod
+    def strip_platform(cls, v):
+        """Strip surrounding whitespace so a blank platform is rejected"""
+        return v.strip() if isinstance(v, str) else v
 
 
 class Message(BaseModel):
     """Individual message in conversation"""
     role: str = Field(..., description="Either 'user' or 'assistant'")
     content: str = Field(..., description="Message content")
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: float = Field(default_factory=time.time, description="Unix epoch seconds")
     intent: Optional[UserIntent] = None
+    
+    @field_validator("timestamp", mode="before")
+    @classmethod
+    def coerce_timestamp(cls, v):
+        """Convert datetime and ISO-8601 input to epoch seconds"""
+        return parse_timestamp(v)
+    
+    @field_serializer("timestamp", when_used="json")
+    def serialize_timestamp(self, value: float) -> str:
+        """Serialize the epoch timestamp as local ISO-8601"""
+        return datetime.fromtimestamp(value).isoformat()
 
 
 class ConversationContext(BaseModel):
@@ -75,8 +150,7 @@ class ConversationContext(BaseModel):
     
     def get_recent_context(self, n: int = 5) -> str:
         """Get recent conversation context as a formatted string"""
-        recent = self.messages[-n:] if len(self.messages) > n else self.messages
-        return "\n".join([f"{msg.role}: {msg.content}" for msg in recent])
+        return "\n".join(f"{msg.role}: {msg.content}" for msg in self.messages[-n:])
 
 
 class RAGResponse(BaseModel):
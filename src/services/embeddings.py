@@ -5,11 +5,178 @@ This module provides a wrapper around OpenAI's embedding models
 for consistent usage throughout the application.
 """
 
-from typing import List
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
 
-from langchain_openai import OpenAIEmbeddings
+from langchain_core.embeddings import Embeddings
 
 from src.config.settings import get_settings
+from src.services.micro_batcher import MicroBatcher
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    Embeddings wrapper that caches vectors in memory and on disk.
+    
+    Vectors are keyed by a SHA-256 hash of the model name and text, so
+    repeated queries and unchanged documents never hit the API twice.
+    Only document vectors are persisted to disk (the set is bounded by the
+    knowledge base); query vectors live in the in-memory LRU only.
+    """
+    
+    def __init__(
+        self, 
+        underlying: Embeddings, 
+        cache_dir: str, 
+        namespace: str, 
+        max_memory_items: int = 1024
+    ):
+        """
+        Initialize the cache.
+        
+        Args:
+            underlying: Embeddings implementation used on cache misses
+            cache_dir: Directory where vectors are persisted as JSON files
+            namespace: Cache namespace, typically the embedding model name
+            max_memory_items: Maximum number of vectors kept in memory
+        """
+        self.underlying = underlying
+        self.cache_dir = cache_dir
+        self.namespace = namespace
+        self.max_memory_items = max_memory_items
+        self._memory: OrderedDict[str, List[float]] = OrderedDict()
+        self._lock = threading.Lock()
+        
+        os.makedirs(cache_dir, exist_ok=True)
+    
+    def _key(self, text: str) -> str:
+        """Build the cache key for a text."""
+        return hashlib.sha256(f"{self.namespace}:{text}".encode("utf-8")).hexdigest()
+    
+    def _remember(self, key: str, vector: List[float]) -> None:
+        """Store a vector in the in-memory LRU."""
+        with self._lock:
+            self._memory[key] = vector
+            self._memory.move_to_end(key)
+            if len(self._memory) > self.max_memory_items:
+                self._memory.popitem(last=False)
+    
+    def _load(self, key: str) -> Optional[List[float]]:
+        """Look up a vector in memory, then on disk."""
+        with self._lock:
+            vector = self._memory.get(key)
+            if vector is not None:
+                self._memory.move_to_end(key)
+                return vector
+        
+        path = os.path.join(self.cache_dir, f"{key}.json")
+        try:
+            with open(path, encoding="utf-8") as f:
+                vector = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (json.JSONDecodeError, OSError):
+            # Corrupt entry (e.g. from an interrupted write): drop it and recompute
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        self._remember(key, vector)
+        return vector
+    
+    def get_cached(self, text: str) -> Optional[List[float]]:
+        """
+        Return the in-memory cached vector for a text without any I/O.
+        
+        Args:
+            text: Text to look up
+            
+        Returns:
+            Cached embedding vector, or None if not in memory
+        """
+        key = self._key(text)
+        with self._lock:
+            return self._memory.get(key)
+    
+    def _store(self, key: str, vector: List[float]) -> None:
+        """Persist a vector to disk and memory."""
+        # Write to a temp file and rename, so readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(vector, f)
+            os.replace(tmp_path, os.path.join(self.cache_dir, f"{key}.json"))
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        self._remember(key, vector)
+    
+    def _embed(
+        self, 
+        texts: List[str], 
+        save: Callable[[str, List[float]], None]
+    ) -> List[List[float]]:
+        """Embed texts, calling the underlying model only for cache misses."""
+        keys = [self._key(text) for text in texts]
+        vectors = [self._load(key) for key in keys]
+        
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if missing:
+            fresh = self.underlying.embed_documents([texts[i] for i in missing])
+            for i, vector in zip(missing, fresh):
+                save(keys[i], vector)
+                vectors[i] = vector
+        
+        return vectors
+    
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed documents, calling the underlying model only for cache misses.
+        
+        Args:
+            texts: List of text strings to embed
+            
+        Returns:
+            List of embedding vectors
+        """
+        return self._embed(texts, self._store)
+    
+    def embed_queries(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed several queries, keeping new vectors in memory only.
+        
+        Args:
+            texts: Query texts to embed
+            
+        Returns:
+            List of embedding vectors
+        """
+        return self._embed(texts, self._remember)
+    
+    def embed_query(self, text: str) -> List[float]:
+        """
+        Embed a query, reusing a cached vector when available.
+        
+        Args:
+            text: Query text to embed
+            
+        Returns:
+            Embedding vector for the query
+        """
+        key = self._key(text)
+        vector = self._load(key)
+        if vector is None:
+            vector = self.underlying.embed_query(text)
+            self._remember(key, vector)
+        return vector
 
 
 class EmbeddingService:
@@ -24,23 +191,41 @@ class EmbeddingService:
         """Initialize the embedding service with settings."""
         self.settings = get_settings()
         self._embeddings = None
+        
+        # Coalesces concurrent query embeddings into one batched API call
+        self._query_batcher = MicroBatcher(
+            self._aembed_query_batch,
+            max_batch_size=32,
+            max_wait_ms=5
+        )
     
     @property
-    def embeddings(self) -> OpenAIEmbeddings:
+    def embeddings(self) -> Embeddings:
         """
         Get or create the OpenAI embeddings instance.
         
         Lazy initialization to avoid creating the embeddings object
-        until it's actually needed.
+        until it's actually needed. When an embedding cache path is
+        configured, the instance is wrapped with CachedEmbeddings.
         
         Returns:
-            OpenAIEmbeddings: Configured embeddings instance
+            Embeddings: Configured embeddings instance
         """
         if self._embeddings is None:
+            # Deferred: importing langchain_openai builds many pydantic schemas
+            from langchain_openai import OpenAIEmbeddings
+            
+            model = "text-embedding-3-small"  # cost-effective embedding model
             self._embeddings = OpenAIEmbeddings(
                 openai_api_key=self.settings.openai_api_key,
-                model="text-embedding-3-small"  # cost-effective embedding model
+                model=model
             )
+            if self.settings.embedding_cache_path:
+                self._embeddings = CachedEmbeddings(
+                    self._embeddings,
+                    cache_dir=self.settings.embedding_cache_path,
+                    namespace=model
+                )
         return self._embeddings
     
     def embed_documents(self, texts: List[str]) -> List[List[float]]:
@@ -55,6 +240,31 @@ class EmbeddingService:
         """
         return self.embeddings.embed_documents(texts)
     
+    def embed_documents_batched(
+        self, 
+        texts: List[str], 
+        batch_size: int = 256, 
+        concurrency: int = 8
+    ) -> List[List[float]]:
+        """
+        Generate embeddings for many documents with concurrent batched requests.
+        
+        Splits the input into fixed-size batches and embeds them in parallel,
+        so large knowledge bases aren't embedded one round-trip at a time.
+        
+        Args:
+            texts: List of text strings to embed
+            batch_size: Number of texts per embeddings request
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            List of embedding vectors, in input order
+        """
+        batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = pool.map(self.embeddings.embed_documents, batches)
+        return [vector for batch in results for vector in batch]
+    
     def embed_query(self, text: str) -> List[float]:
         """
         Generate embedding for a single query.
@@ -66,3 +276,30 @@ class EmbeddingService:
             Embedding vector for the query
         """
         return self.embeddings.embed_query(text)
+    
+    async def aembed_query(self, text: str) -> List[float]:
+        """
+        Asynchronously generate embedding for a single query.
+        
+        Queries arriving concurrently from different chat sessions are
+        micro-batched into a single embeddings request.
+        
+        Args:
+            text: Query text to embed
+            
+        Returns:
+            Embedding vector for the query
+        """
+        # In-memory cache hits skip the batching window entirely
+        if isinstance(self.embeddings, CachedEmbeddings):
+            cached = self.embeddings.get_cached(text)
+            if cached is not None:
+                return cached
+        
+        return await self._query_batcher.submit(text)
+    
+    async def _aembed_query_batch(self, texts: List[str]) -> List[List[float]]:
+        """Embed a batch of concurrently submitted queries in one API call."""
+        if isinstance(self.embeddings, CachedEmbeddings):
+            return await asyncio.to_thread(self.embeddings.embed_queries, texts)
+        return await self.embeddings.aembed_documents(texts)
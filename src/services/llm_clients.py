@@ -0,0 +1,89 @@
+"""
+Shared chat model clients.
+
+ChatOpenAI instances are created once per configuration and reuse a
+process-wide HTTP connection pool, so TLS handshakes are amortized across
+chat sessions instead of being paid by every new client.
+"""
+
+from functools import lru_cache
+from typing import List
+
+import httpx
+from langchain_core.messages import BaseMessage
+from langchain_core.messages.utils import count_tokens_approximately
+from langchain_openai import ChatOpenAI
+
+from src.config.settings import get_settings
+
+
+# Connection pool limits shared by every chat model client
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=50)
+HTTP_TIMEOUT = 30.0
+
+
+@lru_cache()
+def get_http_clients() -> tuple[httpx.Client, httpx.AsyncClient]:
+    """
+    Get the shared sync and async HTTP clients.
+    
+    Returns:
+        Tuple of (sync client, async client) with pooled connections
+    """
+    return (
+        httpx.Client(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT),
+        httpx.AsyncClient(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT),
+    )
+
+
+def get_llm(temperature: float = 0.7) -> ChatOpenAI:
+    """
+    Get a cached streaming ChatOpenAI client for the given temperature.
+    
+    Arguments are normalized before the cache lookup, so get_llm(),
+    get_llm(0.7) and get_llm(temperature=0.7) share one client.
+    
+    Args:
+        temperature: Sampling temperature for the model
+        
+    Returns:
+        ChatOpenAI: Shared client backed by the pooled HTTP clients
+    """
+    return _create_llm(float(temperature))
+
+
+@lru_cache()
+def _create_llm(temperature: float) -> ChatOpenAI:
+    """Build a ChatOpenAI client; cached per (positional) temperature."""
+    settings = get_settings()
+    http_client, http_async_client = get_http_clients()
+    
+    return ChatOpenAI(
+        model=settings.model_name,
+        temperature=temperature,
+        streaming=True,
+        api_key=settings.openai_api_key,
+        http_client=http_client,
+        http_async_client=http_async_client,
+        max_retries=2
+    )
+
+
+def count_message_tokens(messages: List[BaseMessage]) -> int:
+    """
+    Count the tokens a list of messages uses with the configured model.
+    
+    ChatOpenAI only counts tokens for the gpt-3.5/gpt-4/gpt-5 families and
+    raises NotImplementedError for others (e.g. o3-mini), so those fall
+    back to an approximate count.
+    
+    Args:
+        messages: Messages to count
+        
+    Returns:
+        Token count (approximate for unsupported models)
+    """
+    try:
+        return get_llm().get_num_tokens_from_messages(messages)
+    except NotImplementedError:
+        return count_tokens_approximately(messages)
@@ -0,0 +1,100 @@
+"""
+Micro-batching for concurrent async requests.
+
+Coalesces single-item requests that arrive within a short window into one
+batched call, so backends with batch APIs (embeddings, vector search) pay
+their per-call overhead once per batch instead of once per request.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class MicroBatcher(Generic[T, R]):
+    """
+    Collects concurrent requests and dispatches them as a single batch.
+    
+    A batch is flushed when it reaches max_batch_size or when max_wait_ms
+    has elapsed since its first request, whichever comes first.
+    """
+    
+    def __init__(
+        self, 
+        batch_fn: Callable[[List[T]], Awaitable[List[R]]], 
+        max_batch_size: int = 32, 
+        max_wait_ms: float = 5
+    ):
+        """
+        Initialize the batcher.
+        
+        Args:
+            batch_fn: Coroutine mapping a list of items to results in the same order
+            max_batch_size: Maximum number of items per batch
+            max_wait_ms: Maximum time the first item of a batch waits for company
+        """
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._pending: List[tuple[T, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: set[asyncio.Task] = set()
+    
+    async def submit(self, item: T) -> R:
+        """
+        Submit one item and wait for its result.
+        
+        Args:
+            item: Request item passed to batch_fn
+            
+        Returns:
+            Result for this item
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+        
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        
+        return await future
+    
+    def _flush(self) -> None:
+        """Dispatch all pending items as one batch."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+    
+    async def _run(self, batch: List[tuple[T, asyncio.Future]]) -> None:
+        """Run batch_fn and resolve each waiting future with its result."""
+        try:
+            results = await self.batch_fn([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(
+                    f"batch_fn returned {len(results)} results for {len(batch)} items"
+                )
+        except BaseException as e:
+            # Includes cancellation, which must not leave waiters pending forever
+            for _, future in batch:
+                if not future.done():
+                    if isinstance(e, asyncio.CancelledError):
+                        future.cancel()
+                    else:
+                        future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+        
+        for (_, future), result in zip(batch, results, strict=True):
+            if not future.done():
+                future.set_result(result)
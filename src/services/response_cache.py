@@ -0,0 +1,130 @@
+"""
+Semantic cache for complete agent responses.
+
+Answers are stored with the user query that produced them (normalized text
+and embedding), the session that asked it, and a hash of the conversation
+history they were generated from. A later query with the same history is
+answered from the cache without calling the LLM when its text is identical,
+or, within the same session, when its embedding is near-identical.
+"""
+
+import hashlib
+from collections import deque
+from typing import List, Optional
+
+import numpy as np
+from langchain_core.messages import BaseMessage
+
+
+class SemanticResponseCache:
+    """
+    In-memory response cache matched by query text and cosine similarity.
+    
+    Entries are scoped by conversation history, so cached answers are only
+    reused in the same conversational state (typically the first turn).
+    Across sessions only an exact (normalized) query text hits: queries that
+    differ in a single word, such as the user's name, embed almost
+    identically, so semantic matches stay within the session that stored them.
+    """
+    
+    def __init__(self, threshold: float = 0.95, max_entries: int = 256):
+        """
+        Initialize the cache.
+        
+        Args:
+            threshold: Minimum cosine similarity for a cache hit
+            max_entries: Maximum number of cached responses (oldest evicted first)
+        """
+        self.threshold = threshold
+        self._entries: deque[tuple[str, str, str, np.ndarray, str]] = deque(maxlen=max_entries)
+    
+    @staticmethod
+    def history_key(conversation_history: List[BaseMessage]) -> str:
+        """
+        Hash the conversation history a response depends on.
+        
+        Args:
+            conversation_history: Messages from previous turns
+            
+        Returns:
+            Hex digest identifying the conversational state
+        """
+        digest = hashlib.sha256()
+        for msg in conversation_history:
+            digest.update(f"{msg.type}\x00{msg.content}\x00".encode("utf-8"))
+        return digest.hexdigest()
+    
+    @staticmethod
+    def _normalize_query(query: str) -> str:
+        """Case- and whitespace-insensitive form of a query for exact matching."""
+        return " ".join(query.lower().split())
+    
+    @staticmethod
+    def _normalize(embedding: List[float]) -> np.ndarray:
+        """Convert an embedding to a unit-length float32 vector."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+    
+    def lookup(
+        self, 
+        session_id: str, 
+        history_key: str, 
+        query: str, 
+        embedding: List[float]
+    ) -> Optional[str]:
+        """
+        Find a cached response for an equivalent query.
+        
+        Args:
+            session_id: Id of the chat session asking
+            history_key: Key from history_key() for the current conversation
+            query: Current user query
+            embedding: Embedding of the current user query
+            
+        Returns:
+            Cached response text, or None on a miss
+        """
+        normalized_query = self._normalize_query(query)
+        candidates = []
+        for session, key, text, vector, response in self._entries:
+            if key != history_key:
+                continue
+            if text == normalized_query:
+                return response
+            if session == session_id:
+                candidates.append((vector, response))
+        if not candidates:
+            return None
+        
+        # One vectorized dot product against all candidates (vectors are unit length)
+        scores = np.stack([vector for vector, _ in candidates]) @ self._normalize(embedding)
+        best = int(np.argmax(scores))
+        return candidates[best][1] if scores[best] >= self.threshold else None
+    
+    def store(
+        self, 
+        session_id: str, 
+        history_key: str, 
+        query: str, 
+        embedding: List[float], 
+        response: str
+    ) -> None:
+        """
+        Cache a response.
+        
+        Args:
+            session_id: Id of the chat session that asked
+            history_key: Key from history_key() for the conversation it answered
+            query: User query
+            embedding: Embedding of the user query
+            response: Final response text
+        """
+        if response:
+            self._entries.append((
+                session_id, 
+                history_key, 
+                self._normalize_query(query), 
+                self._normalize(embedding), 
+                response
+            ))
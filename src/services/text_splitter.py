@@ -0,0 +1,52 @@
+"""
+Text splitter specialized for the markdown knowledge base.
+
+Markdown documents are almost always cleanly separated by blank lines, so
+a single pass over paragraph boundaries replaces the recursive
+multi-separator search of RecursiveCharacterTextSplitter.
+"""
+
+from typing import Any, List
+
+from langchain_text_splitters import RecursiveCharacterTextSplitter, TextSplitter
+
+
+class ParagraphTextSplitter(TextSplitter):
+    """
+    Splits text on blank lines and greedily merges paragraphs into chunks.
+    
+    Paragraphs are packed up to chunk_size with chunk_overlap carried over
+    between chunks. Only paragraphs that are themselves longer than
+    chunk_size fall back to recursive splitting.
+    """
+    
+    def __init__(self, **kwargs: Any):
+        """Initialize the splitter (accepts TextSplitter keyword arguments)."""
+        super().__init__(**kwargs)
+        self._fallback = RecursiveCharacterTextSplitter(
+            chunk_size=self._chunk_size,
+            chunk_overlap=self._chunk_overlap,
+            length_function=self._length_function,
+            separators=["\n", " ", ""]
+        )
+    
+    def split_text(self, text: str) -> List[str]:
+        """
+        Split text into chunks along paragraph boundaries.
+        
+        Args:
+            text: Document text
+            
+        Returns:
+            List of text chunks
+        """
+        splits: List[str] = []
+        for paragraph in text.split("\n\n"):
+            if not paragraph.strip():
+                continue
+            if self._length_function(paragraph) > self._chunk_size:
+                splits.extend(self._fallback.split_text(paragraph))
+            else:
+                splits.append(paragraph)
+        
+        return self._merge_splits(splits, "\n\n")
@@ -5,16 +5,25 @@ Handles document loading, chunking, embedding, and retrieval
 using ChromaDB as the vector database.
 """
 
+import asyncio
+import hashlib
 import os
-from typing import List, Optional
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, List, Optional
 
-from langchain_text_splitters import RecursiveCharacterTextSplitter
-from langchain_community.document_loaders import DirectoryLoader, TextLoader
-from langchain_community.vectorstores import Chroma
+import numpy as np
 from langchain_core.documents import Document
 
 from src.config.settings import get_settings
 from src.services.embeddings import EmbeddingService
+from src.services.micro_batcher import MicroBatcher
+
+if TYPE_CHECKING:
+    # Heavy imports (chromadb, document loaders) are deferred until first use
+    from langchain_community.vectorstores import Chroma
+    
+    from src.services.text_splitter import ParagraphTextSplitter
 
 
 class VectorStoreManager:
@@ -25,19 +34,50 @@ class VectorStoreManager:
     into chunks, generating embeddings, and storing in ChromaDB.
     """
     
+    # Maximum number of chunks written to Chroma per upsert
+    INGEST_BATCH_SIZE = 5000
+    
     def __init__(self):
         """Initialize the vector store manager."""
         self.settings = get_settings()
         self.embedding_service = EmbeddingService()
-        self._vector_store: Optional[Chroma] = None
-        
-        # Text splitter configuration for chunking documents
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=1000,  # reasonable chunk size for context
-            chunk_overlap=200,  # overlap to maintain context between chunks
-            length_function=len,
-            separators=["\n\n", "\n", " ", ""]
+        self._vector_store: Optional["Chroma"] = None
+        self._init_lock = threading.Lock()
+        
+        # LRU cache of search results keyed by (normalized query, k, fetch_k)
+        self._search_cache: OrderedDict[tuple[str, int, int], List[Document]] = OrderedDict()
+        self.search_cache_size = 512
+        
+        # Coalesces concurrent MMR searches into a single Chroma query
+        self._search_batcher = MicroBatcher(
+            self._amax_marginal_relevance_batch,
+            max_batch_size=32,
+            max_wait_ms=5
         )
+        
+        # Built on first ingest, see text_splitter
+        self._text_splitter: Optional["ParagraphTextSplitter"] = None
+    
+    @property
+    def text_splitter(self) -> "ParagraphTextSplitter":
+        """
+        Get or create the text splitter used to chunk markdown documents.
+        
+        Lazy initialization, since it's only needed on ingest and importing
+        it pulls in langchain_text_splitters.
+        
+        Returns:
+            Configured text splitter
+        """
+        if self._text_splitter is None:
+            from src.services.text_splitter import ParagraphTextSplitter
+            
+            self._text_splitter = ParagraphTextSplitter(
+                chunk_size=1000,  # reasonable chunk size for context
+                chunk_overlap=200,  # overlap to maintain context between chunks
+                length_function=len
+            )
+        return self._text_splitter
     
     def load_documents(self) -> List[Document]:
         """
@@ -54,12 +94,17 @@ class VectorStoreManager:
                 f"Knowledge base directory not found: {kb_path}"
             )
         
+        from langchain_community.document_loaders import DirectoryLoader, TextLoader
+        
         # Load all markdown files from the knowledge base
         loader = DirectoryLoader(
             kb_path,
             glob="**/*.md",
             loader_cls=TextLoader,
-            loader_kwargs={"encoding": "utf-8"}
+            loader_kwargs={"encoding": "utf-8"},
+            use_multithreading=True,  # overlap per-file reads
+            max_concurrency=8,
+            show_progress=False
         )
         
         documents = loader.load()
@@ -86,7 +131,13 @@ class VectorStoreManager:
         print(f"Split documents into {len(chunks)} chunks")
         return chunks
     
-    def initialize_vector_store(self, force_reload: bool = False) -> Chroma:
+    @staticmethod
+    def _chunk_id(chunk: Document) -> str:
+        """Derive a stable id for a chunk from its source and content."""
+        source = chunk.metadata.get("source", "")
+        return hashlib.sha256(f"{source}\x00{chunk.page_content}".encode("utf-8")).hexdigest()
+    
+    def initialize_vector_store(self, force_reload: bool = False) -> "Chroma":
         """
         Initialize or load the ChromaDB vector store.
         
@@ -96,7 +147,10 @@ class VectorStoreManager:
         Returns:
             Initialized ChromaDB vector store
         """
+        from langchain_community.vectorstores import Chroma
+        
         db_path = self.settings.chroma_db_path
+        self._search_cache.clear()
         
         # Create directory if it doesn't exist
         os.makedirs(db_path, exist_ok=True)
@@ -114,39 +168,85 @@ class VectorStoreManager:
             documents = self.load_documents()
             chunks = self.split_documents(documents)
             
-            # Create vector store with embeddings
-            self._vector_store = Chroma.from_documents(
-                documents=chunks,
-                embedding=self.embedding_service.embeddings,
-                persist_directory=db_path
+            # Content-derived ids make re-ingestion (force_reload) idempotent;
+            # identical chunks collapse to a single entry
+            chunks_by_id = {self._chunk_id(chunk): chunk for chunk in chunks}
+            chunks = list(chunks_by_id.values())
+            
+            # Embed all chunks up front with concurrent batched requests, then
+            # add the precomputed vectors so Chroma doesn't re-embed them
+            texts = [chunk.page_content for chunk in chunks]
+            vectors = self.embedding_service.embed_documents_batched(texts)
+            
+            self._vector_store = Chroma(
+                persist_directory=db_path,
+                embedding_function=self.embedding_service.embeddings
             )
+            ids = list(chunks_by_id)
+            metadatas = [chunk.metadata for chunk in chunks]
+            
+            # Write in large slices (bounded by Chroma's own limit) so the
+            # SQLite commit cost is paid once per slice, not per document
+            batch_size = min(
+                self.INGEST_BATCH_SIZE,
+                self._vector_store._client.get_max_batch_size()
+            )
+            for start in range(0, len(ids), batch_size):
+                end = start + batch_size
+                self._vector_store._collection.upsert(
+                    ids=ids[start:end],
+                    embeddings=vectors[start:end],
+                    documents=texts[start:end],
+                    metadatas=metadatas[start:end]
+                )
             print("Vector store created and persisted")
         
         return self._vector_store
     
     @property
-    def vector_store(self) -> Chroma:
+    def vector_store(self) -> "Chroma":
         """
         Get the vector store instance, initializing if necessary.
         
         Returns:
             ChromaDB vector store
         """
-        if self._vector_store is None:
-            self.initialize_vector_store()
-        return self._vector_store
+        return self.get_vector_store()
     
-    def get_vector_store(self) -> Chroma:
+    def get_vector_store(self) -> "Chroma":
         """
         Get the vector store instance, initializing if necessary.
         
+        Thread-safe, so concurrent chat sessions starting at the same
+        time load the store only once.
+        
         Returns:
             ChromaDB vector store
         """
         if self._vector_store is None:
-            self.initialize_vector_store()
+            with self._init_lock:
+                if self._vector_store is None:
+                    self.initialize_vector_store()
         return self._vector_store
     
+    @staticmethod
+    def _search_cache_key(query: str, k: int, fetch_k: int = 0) -> tuple[str, int, int]:
+        """Normalize case and whitespace so trivially different queries share a key."""
+        return " ".join(query.lower().split()), k, fetch_k
+    
+    def _cached_search(self, key: tuple[str, int, int]) -> Optional[List[Document]]:
+        """Return cached search results for a key, if present."""
+        docs = self._search_cache.get(key)
+        if docs is not None:
+            self._search_cache.move_to_end(key)
+        return docs
+    
+    def _cache_search(self, key: tuple[str, int, int], docs: List[Document]) -> None:
+        """Store search results, evicting the least recently used entry."""
+        self._search_cache[key] = docs
+        if len(self._search_cache) > self.search_cache_size:
+            self._search_cache.popitem(last=False)
+    
     def similarity_search(
         self, 
         query: str, 
@@ -162,7 +262,135 @@ class VectorStoreManager:
         Returns:
             List of relevant documents
         """
-        return self.vector_store.similarity_search(query, k=k)
+        key = self._search_cache_key(query, k)
+        docs = self._cached_search(key)
+        if docs is None:
+            docs = self.vector_store.similarity_search(query, k=k)
+            self._cache_search(key, docs)
+        return docs
+    
+    async def amax_marginal_relevance_search(
+        self, 
+        query: str, 
+        k: int = 4, 
+        fetch_k: Optional[int] = None, 
+        embedding: Optional[List[float]] = None
+    ) -> List[Document]:
+        """
+        Asynchronously retrieve relevant yet diverse documents for the query.
+        
+        Fetches a larger candidate pool in a single ANN query and reranks
+        it in memory with maximal marginal relevance, so near-duplicate
+        chunks don't crowd out other useful context. Concurrent searches
+        are micro-batched into one Chroma query.
+        
+        Args:
+            query: Search query
+            k: Number of results to return
+            fetch_k: Candidate pool size (defaults to settings.retrieval_fetch_k)
+            embedding: Precomputed query embedding, to avoid embedding twice
+            
+        Returns:
+            List of relevant documents
+        """
+        fetch_k = fetch_k or self.settings.retrieval_fetch_k
+        key = self._search_cache_key(query, k, fetch_k)
+        docs = self._cached_search(key)
+        if docs is None:
+            # Embed through the (cached) embedding service, then search by vector
+            if embedding is None:
+                embedding = await self.embedding_service.aembed_query(query)
+            docs = await self._search_batcher.submit((embedding, k, fetch_k))
+            self._cache_search(key, docs)
+        return docs
+    
+    async def _amax_marginal_relevance_batch(
+        self, 
+        requests: List[tuple[List[float], int, int]]
+    ) -> List[List[Document]]:
+        """Run a batch of MMR searches off the event loop."""
+        return await asyncio.to_thread(self._max_marginal_relevance_batch, requests)
+    
+    def _max_marginal_relevance_batch(
+        self, 
+        requests: List[tuple[List[float], int, int]]
+    ) -> List[List[Document]]:
+        """
+        Run several MMR searches with a single Chroma query.
+        
+        Args:
+            requests: (query embedding, k, fetch_k) tuples
+            
+        Returns:
+            Selected documents for each request, in request order
+        """
+        from langchain_community.vectorstores.utils import maximal_marginal_relevance
+        
+        results = self.vector_store._collection.query(
+            query_embeddings=[embedding for embedding, _, _ in requests],
+            n_results=max(fetch_k for _, _, fetch_k in requests),
+            include=["documents", "metadatas", "embeddings"]
+        )
+        
+        batch_docs: List[List[Document]] = []
+        for i, (embedding, k, fetch_k) in enumerate(requests):
+            selected = maximal_marginal_relevance(
+                np.array(embedding, dtype=np.float32),
+                results["embeddings"][i][:fetch_k],
+                k=k
+            )
+            batch_docs.append([
+                Document(
+                    page_content=results["documents"][i][j],
+                    metadata=results["metadatas"][i][j] or {},
+                    id=results["ids"][i][j]
+                )
+                for j in selected
+            ])
+        return batch_docs
+    
+    def format_context(
+        self, 
+        documents: List[Document], 
+        max_chars: Optional[int] = None
+    ) -> str:
+        """
+        Join retrieved documents into a prompt context string.
+        
+        Exact duplicate chunks (after stripping whitespace) are dropped via a
+        content hash and the result is capped at a character budget to keep
+        prompt tokens down.
+        
+        Args:
+            documents: Retrieved documents, best match first
+            max_chars: Character budget (defaults to settings.max_context_chars)
+            
+        Returns:
+            Deduplicated, budget-limited context string
+        """
+        if max_chars is None:
+            max_chars = self.settings.max_context_chars
+        seen = set()
+        parts: List[str] = []
+        total_chars = 0
+        
+        for doc in documents:
+            content = doc.page_content.strip()
+            digest = hashlib.blake2b(content.encode("utf-8"), digest_size=8).digest()
+            if not content or digest in seen:
+                continue
+            seen.add(digest)
+            
+            if total_chars + len(content) > max_chars:
+                # Always keep at least part of the best match
+                if not parts:
+                    parts.append(content[:max_chars])
+                break
+            
+            parts.append(content)
+            total_chars += len(content)
+        
+        return "\n\n".join(parts)
     
     def similarity_search_with_score(
         self, 
@@ -2,10 +2,46 @@
 Lead capture tool using Resend to send emails to admins.
 """
 
-import resend
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from jinja2 import Template
 from langchain.tools import tool
+from pydantic import ValidationError
 
 from src.config.settings import get_settings
+from src.models import LeadCaptureInput
+from src.utils.patterns import PLATFORMS
+
+
+# Lead notification email, compiled once; autoescape keeps user-supplied
+# values from injecting HTML into the admin's inbox
+_LEAD_EMAIL_TEMPLATE = Template(
+    """
+    <html>
+        <body>
+            <h2>New Lead Captured from AutoStream Agent</h2>
+            <p><strong>Name:</strong> {{ name }}</p>
+            <p><strong>Email:</strong> {{ email }}</p>
+            <p><strong>Platform:</strong> {{ platform }}</p>
+            <hr>
+            <p>This lead was captured automatically by the AutoStream AI agent.</p>
+        </body>
+    </html>
+    """,
+    autoescape=True
+)
+
+# Background workers for lead notification emails
+_EMAIL_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="lead-email")
+
+
+def _log_email_result(future: Future, name: str, email: str, platform: str) -> None:
+    """Log the outcome of a background lead notification email."""
+    error = future.exception()
+    if error is not None:
+        print(f"❌ Error sending lead email: {str(error)}")
+    else:
+        print(f"✅ Lead captured: {name} ({email}) - {platform}")
 
 
 def lead_capture(name: str, email: str, platform: str) -> str:
@@ -20,6 +56,14 @@ def lead_capture(name: str, email: str, platform: str) -> str:
     Returns:
         Success message confirming lead capture
     """
+    # Canonicalize exact platform names only (e.g. "youtube" -> "YouTube");
+    # free text such as "YouTube and Twitch" is kept as the user wrote it
+    platform = platform.strip()
+    platform = PLATFORMS.get(platform.lower(), platform)
+    
+    # Deferred so importing the tool doesn't pull in the Resend SDK
+    import resend
+    
     settings = get_settings()
     
     # Set Resend API key
@@ -27,41 +71,26 @@ def lead_capture(name: str, email: str, platform: str) -> str:
     
     # Prepare email content
     subject = f"🎯 New Lead: {name} from {platform}"
-    html_content = f"""
-    <html>
-        <body>
-            <h2>New Lead Captured from AutoStream Agent</h2>
-            <p><strong>Name:</strong> {name}</p>
-            <p><strong>Email:</strong> {email}</p>
-            <p><strong>Platform:</strong> {platform}</p>
-            <hr>
-            <p>This lead was captured automatically by the AutoStream AI agent.</p>
-        </body>
-    </html>
-    """
+    html_content = _LEAD_EMAIL_TEMPLATE.render(name=name, email=email, platform=platform)
     
-    try:
-        # Send email to all admin emails
-        params = {
-            "from": settings.from_email,
-            "to": settings.get_admin_email_list(),
-            "subject": subject,
-            "html": html_content,
-        }
-        
-        resend.Emails.send(params)
-        
-        # Log successful capture
-        print(f"✅ Lead captured: {name} ({email}) - {platform}")
-        
-        return f"Thank you, {name}! 🎉 Your information has been received. Our team will reach out to you at {email} shortly to help you get started with AutoStream!"
-        
-    except Exception as e:  # noqa: BLE001
-        print(f"❌ Error sending lead email: {str(e)}")
-        return f"Thank you for your interest, {name}! We've noted your details and will be in touch soon."
+    # Send email to all admin emails in the background; the reply to the
+    # user doesn't depend on delivery, so don't make them wait for Resend
+    params = {
+        "from": settings.from_email,
+        "to": settings.get_admin_email_list(),
+        "subject": subject,
+        "html": html_content,
+    }
+    
+    future = _EMAIL_EXECUTOR.submit(resend.Emails.send, params)
+    future.add_done_callback(
+        lambda f: _log_email_result(f, name, email, platform)
+    )
+    
+    return f"Thank you, {name}! 🎉 Your information has been received. Our team will reach out to you at {email} shortly to help you get started with AutoStream!"
 
 
-@tool
+@tool(args_schema=LeadCaptureInput)
 def lead_capture_tool(name: str, email: str, platform: str) -> str:
     """
     LangChain tool wrapper for lead_capture.
@@ -80,3 +109,27 @@ def lead_capture_tool(name: str, email: str, platform: str) -> str:
         Success message from lead_capture
     """
     return lead_capture(name, email, platform)
+
+
+def describe_validation_error(error: ValidationError) -> str:
+    """
+    Turn a tool argument validation error into guidance for the LLM.
+    
+    Uses the structured error locations rather than matching on the
+    error message text.
+    
+    Args:
+        error: Validation error raised for the tool arguments
+        
+    Returns:
+        Message naming the fields that need to be collected again
+    """
+    fields = sorted({str(err["loc"][0]) for err in error.errors() if err["loc"]})
+    return (
+        f"Invalid or missing lead details: {', '.join(fields)}. "
+        "Please ask the user to provide them again before calling lead_capture."
+    )
+
+
+# Malformed arguments are reported back to the LLM instead of raising
+lead_capture_tool.handle_validation_error = describe_validation_error
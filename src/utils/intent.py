@@ -0,0 +1,64 @@
+"""
+Rule-based fast path for intent detection.
+
+Resolves trivially classifiable messages (short greetings and thanks, or a
+bare platform name answering the lead questions) locally in microseconds,
+so the agent can skip work such as knowledge base retrieval that those
+turns don't need. Messages carrying an email are left to the full pipeline,
+since a question riding along with it can't be ruled out reliably.
+"""
+
+from typing import Optional
+
+from src.models import IntentType
+from src.utils.patterns import EMAIL_RE, GREETING_RE, PLATFORMS, SELF_INTRO_RE
+
+
+# Closing small talk that never needs knowledge base context (hashed O(1) lookup)
+SMALL_TALK_PHRASES = frozenset({
+    "thanks", "thank you", "thanks a lot", "thank you so much", "thx", "ty",
+    "bye", "goodbye", "see you", "cheers",
+})
+
+# Messages longer than this are likely to carry a real question as well
+MAX_GREETING_LENGTH = 30
+
+
+def detect_intent_fast(message: str) -> Optional[IntentType]:
+    """
+    Classify a message with cheap local rules.
+    
+    Args:
+        message: Raw user message
+        
+    Returns:
+        The detected intent, or None if the message is ambiguous and
+        should be handled by the full pipeline
+    """
+    if len(message) < MAX_GREETING_LENGTH:
+        if GREETING_RE.match(message):
+            return IntentType.CASUAL_GREETING
+        
+        # Normalize once and reuse for the set lookup
+        normalized = message.strip(" \t\n!.,").lower()
+        if normalized in SMALL_TALK_PHRASES:
+            return IntentType.CASUAL_GREETING
+        
+        # A bare platform name answers "which platform do you create for?"
+        if normalized in PLATFORMS:
+            return IntentType.HIGH_INTENT_LEAD
+    
+    return None
+
+
+def is_self_identifying(message: str) -> bool:
+    """
+    Check whether a message carries the user's identity.
+    
+    Args:
+        message: Raw user message
+        
+    Returns:
+        True if the message contains an email address or a self-introduction
+    """
+    return bool(EMAIL_RE.search(message) or SELF_INTRO_RE.search(message))
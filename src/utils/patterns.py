@@ -0,0 +1,51 @@
+"""
+Precompiled regular expressions shared across the application.
+
+Patterns are compiled once at import so hot paths call the compiled
+matcher directly instead of going through the `re` module cache.
+"""
+
+import re
+
+# Email address. Quantifiers are bounded by the RFC 5321 length limits so
+# backtracking stays linear in the input, even on long adversarial pastes.
+EMAIL_RE = re.compile(r"\b[A-Za-z0-9._%+-]{1,64}@[A-Za-z0-9.-]{1,253}\.[A-Za-z]{2,63}\b")
+
+# Cheap structural check (one "@", a dot in the domain, no whitespace) used to
+# reject obviously invalid addresses before full email-validator parsing
+EMAIL_PREFILTER_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# Bare address with no whitespace or angle brackets; only these are pre-checked,
+# since EmailStr also accepts the "Display Name <addr>" form
+EMAIL_PLAIN_CHARS_RE = re.compile(r"[^\s<>]+")
+
+# User introducing themselves ("my name is Priya", "name: Priya", "i'm priya",
+# "hey it's Priya", "Priya here - ..."). Case-insensitive, so after "I'm"/"it's"
+# common non-name continuations are excluded to keep "I'm looking for..." and
+# "it's too expensive" cacheable. A false positive only costs a cache miss.
+_NOT_A_NAME = (
+    r"a|an|the|so|too|very|really|just|not|also|still|now|new|here|there|on|in|"
+    r"at|for|from|with|about|into|going|getting|trying|looking|interested|"
+    r"curious|wondering|thinking|planning|ready|sure|confused|currently|using|"
+    r"starting|building|making|creating|working|streaming|posting|only|"
+    r"possible|worth|free|fine|ok|okay|good|great|available|included|been"
+)
+SELF_INTRO_RE = re.compile(
+    r"\b(?:my\s+name\s+is|my\s+name's|name's|call\s+me|this\s+is)\s+\w"
+    r"|\bname\s*[:=]\s*\w"
+    r"|\b(?:i\s+am|i'm|im|it's)\s+(?!(?:" + _NOT_A_NAME + r")\b)[a-z]"
+    r"|^\W*(?:(?:hi|hey|hello)\W+)?[a-z]+\s+here\b(?!\s+(?:is|are)\b)",
+    re.IGNORECASE
+)
+
+# Message that is only a greeting ("hi", "Hello there!", "good morning")
+GREETING_RE = re.compile(
+    r"^\s*(hi|hello|hey|hiya|yo|good (morning|afternoon|evening))( there)?[\s!.,]*$",
+    re.IGNORECASE
+)
+
+# Canonical spelling for each supported content platform, keyed by lowercase name
+PLATFORMS = {
+    name.lower(): name
+    for name in ("YouTube", "Instagram", "TikTok", "Facebook", "Twitter", "Twitch", "LinkedIn")
+}
@@ -5,10 +5,10 @@ This module provides functionality to load prompt templates from
 markdown files and render them with dynamic variables.
 """
 
-import os
+from functools import lru_cache
 from typing import Any, Dict
 
-from jinja2 import Environment, FileSystemLoader, Template
+from jinja2 import Environment, FileSystemLoader, Template, TemplateNotFound
 
 from src.config.settings import get_settings
 
@@ -26,11 +26,14 @@ class PromptLoader:
         self.settings = get_settings()
         self.prompts_path = self.settings.prompts_path
         
-        # Create Jinja2 environment
+        # Create Jinja2 environment. Prompts don't change while the app runs,
+        # so compiled templates are cached without limit or mtime checks.
         self.env = Environment(
             loader=FileSystemLoader(self.prompts_path),
             trim_blocks=True,
-            lstrip_blocks=True
+            lstrip_blocks=True,
+            cache_size=-1,
+            auto_reload=False
         )
     
     def load_template(self, template_name: str) -> Template:
@@ -46,14 +49,12 @@ class PromptLoader:
         Raises:
             FileNotFoundError: If template file doesn't exist
         """
-        template_path = os.path.join(self.prompts_path, template_name)
-        
-        if not os.path.exists(template_path):
+        try:
+            return self.env.get_template(template_name)
+        except TemplateNotFound:
             raise FileNotFoundError(
-                f"Prompt template not found: {template_path}"
-            )
-        
-        return self.env.get_template(template_name)
+                f"Prompt template not found: {self.prompts_path}/{template_name}"
+            ) from None
     
     def render(
         self, 
@@ -86,3 +87,14 @@ class PromptLoader:
             Rendered prompt string
         """
         return self.render(template_name, kwargs)
+
+
+@lru_cache()
+def get_prompt_loader() -> PromptLoader:
+    """
+    Get cached prompt loader instance.
+    
+    Returns:
+        PromptLoader: Shared loader, so the Jinja2 template cache is shared too
+    """
+    return PromptLoader()
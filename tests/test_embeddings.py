@@ -0,0 +1,91 @@
+"""Tests for the in-memory and on-disk embedding cache."""
+
+import os
+from typing import List
+
+from langchain_core.embeddings import Embeddings
+
+from src.services.embeddings import CachedEmbeddings
+
+
+class FakeEmbeddings(Embeddings):
+    """Deterministic embeddings that count calls to the underlying model."""
+    
+    def __init__(self):
+        self.calls: List[List[str]] = []
+    
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        self.calls.append(list(texts))
+        return [[float(len(text)), 1.0] for text in texts]
+    
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+
+def make_cache(tmp_path, **kwargs):
+    underlying = FakeEmbeddings()
+    cache = CachedEmbeddings(underlying, cache_dir=str(tmp_path), namespace="test", **kwargs)
+    return cache, underlying
+
+
+def cache_files(tmp_path) -> List[str]:
+    return sorted(name for name in os.listdir(tmp_path) if name.endswith(".json"))
+
+
+def test_memory_hit_skips_underlying_model(tmp_path):
+    cache, underlying = make_cache(tmp_path)
+    
+    first = cache.embed_documents(["alpha", "beta"])
+    second = cache.embed_documents(["beta", "alpha"])
+    
+    assert second == [first[1], first[0]]
+    assert underlying.calls == [["alpha", "beta"]]
+
+
+def test_disk_hit_survives_new_instance(tmp_path):
+    cache, _ = make_cache(tmp_path)
+    vectors = cache.embed_documents(["alpha"])
+    
+    fresh, underlying = make_cache(tmp_path)
+    
+    assert fresh.embed_documents(["alpha"]) == vectors
+    assert underlying.calls == []
+
+
+def test_corrupt_file_is_a_miss_and_removed(tmp_path):
+    cache, _ = make_cache(tmp_path)
+    cache.embed_documents(["alpha"])
+    [name] = cache_files(tmp_path)
+    with open(tmp_path / name, "w", encoding="utf-8") as f:
+        f.write('[1.0, 2.')
+    
+    fresh, underlying = make_cache(tmp_path)
+    key = fresh._key("alpha")
+    
+    assert fresh._load(key) is None
+    assert not (tmp_path / name).exists()
+    assert fresh.embed_documents(["alpha"]) == [[5.0, 1.0]]
+    assert underlying.calls == [["alpha"]]
+
+
+def test_queries_are_not_written_to_disk(tmp_path):
+    cache, underlying = make_cache(tmp_path)
+    
+    cache.embed_queries(["what does pro cost?", "is there a trial?"])
+    cache.embed_query("refund policy")
+    
+    assert cache_files(tmp_path) == []
+    assert cache.get_cached("refund policy") == [13.0, 1.0]
+    assert len(underlying.calls) == 2
+
+
+def test_memory_lru_evicts_oldest(tmp_path):
+    cache, _ = make_cache(tmp_path, max_memory_items=2)
+    
+    cache.embed_queries(["a", "bb"])
+    cache.embed_query("a")  # refresh "a" so "bb" is least recently used
+    cache.embed_query("ccc")
+    
+    assert cache.get_cached("a") is not None
+    assert cache.get_cached("ccc") is not None
+    assert cache.get_cached("bb") is None
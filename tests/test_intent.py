@@ -0,0 +1,45 @@
+"""Tests for the rule-based intent fast path."""
+
+from src.models import IntentType
+from src.utils.intent import detect_intent_fast, is_self_identifying
+
+
+def test_greeting_is_casual():
+    assert detect_intent_fast("Hello there!") == IntentType.CASUAL_GREETING
+
+
+def test_greeting_with_question_falls_through():
+    assert detect_intent_fast("hey, how much is pro?") is None
+
+
+def test_bare_platform_is_lead():
+    assert detect_intent_fast("youtube") == IntentType.HIGH_INTENT_LEAD
+
+
+def test_messages_with_email_fall_through():
+    assert detect_intent_fast("John Doe, john@example.com, YouTube") is None
+    assert detect_intent_fast("me@x.co — does Pro include 4K?") is None
+    assert detect_intent_fast("me@x.co which plan has 4K") is None
+    assert detect_intent_fast("jo@x.co - do you offer refunds") is None
+    assert detect_intent_fast("jo@x.co is there a free trial") is None
+    assert detect_intent_fast("Send the Pro pricing to jo@x.co") is None
+    assert detect_intent_fast("jo@x.co, tell me about 4K export") is None
+
+
+def test_self_introduction_is_self_identifying():
+    assert is_self_identifying("My name is Priya and I stream on Twitch — which plan fits me?")
+    assert is_self_identifying("Hi, I'm Priya. Which plan fits me?")
+    assert is_self_identifying("reach me at priya@example.com")
+
+
+def test_informal_introduction_is_self_identifying():
+    assert is_self_identifying("i'm priya, which plan?")
+    assert is_self_identifying("Hey it's Priya, what does Pro cost?")
+    assert is_self_identifying("Priya here - which plan suits me?")
+    assert is_self_identifying("name: Priya")
+
+
+def test_plain_question_is_not_self_identifying():
+    assert not is_self_identifying("I stream on Twitch — which plan fits me?")
+    assert not is_self_identifying("I'm looking for the Pro plan price")
+    assert not is_self_identifying("i'm interested in pro, it's for youtube")
@@ -0,0 +1,33 @@
+"""Tests for the shared chat model helpers."""
+
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.messages.utils import count_tokens_approximately
+
+from src.services import llm_clients
+
+
+MESSAGES = [HumanMessage(content="Which plan has 4K?"), AIMessage(content="The Pro plan.")]
+
+
+class FakeLLM:
+    """Chat model stub with a configurable token counter."""
+    
+    def __init__(self, supported: bool):
+        self.supported = supported
+    
+    def get_num_tokens_from_messages(self, messages):
+        if not self.supported:
+            raise NotImplementedError("get_num_tokens_from_messages() is not presently implemented")
+        return 42
+
+
+def test_count_uses_model_tokenizer(monkeypatch):
+    monkeypatch.setattr(llm_clients, "get_llm", lambda: FakeLLM(supported=True))
+    
+    assert llm_clients.count_message_tokens(MESSAGES) == 42
+
+
+def test_count_falls_back_for_unsupported_models(monkeypatch):
+    monkeypatch.setattr(llm_clients, "get_llm", lambda: FakeLLM(supported=False))
+    
+    assert llm_clients.count_message_tokens(MESSAGES) == count_tokens_approximately(MESSAGES)
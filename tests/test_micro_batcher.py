@@ -0,0 +1,117 @@
+"""Tests for the async micro-batcher."""
+
+import asyncio
+
+import pytest
+
+from src.services.micro_batcher import MicroBatcher
+
+
+def make_recorder(transform=lambda items: [item * 2 for item in items], delay: float = 0):
+    """Build a batch function that records every batch it receives."""
+    calls = []
+    
+    async def batch_fn(items):
+        calls.append(list(items))
+        if delay:
+            await asyncio.sleep(delay)
+        return transform(items)
+    
+    return batch_fn, calls
+
+
+def test_flushes_when_batch_is_full():
+    batch_fn, calls = make_recorder()
+    
+    async def run():
+        # A long timer proves the flush is triggered by size, not by time
+        batcher = MicroBatcher(batch_fn, max_batch_size=3, max_wait_ms=10_000)
+        return await asyncio.wait_for(
+            asyncio.gather(*(batcher.submit(i) for i in range(3))),
+            timeout=1
+        )
+    
+    assert asyncio.run(run()) == [0, 2, 4]
+    assert calls == [[0, 1, 2]]
+
+
+def test_flushes_on_timer():
+    batch_fn, calls = make_recorder()
+    
+    async def run():
+        batcher = MicroBatcher(batch_fn, max_batch_size=100, max_wait_ms=5)
+        return await asyncio.gather(batcher.submit(1), batcher.submit(2))
+    
+    assert asyncio.run(run()) == [2, 4]
+    assert calls == [[1, 2]]
+
+
+def test_exception_reaches_every_waiter():
+    def fail(items):
+        raise RuntimeError("backend down")
+    
+    batch_fn, _ = make_recorder(fail)
+    
+    async def run():
+        batcher = MicroBatcher(batch_fn, max_wait_ms=1)
+        return await asyncio.gather(
+            *(batcher.submit(i) for i in range(3)),
+            return_exceptions=True
+        )
+    
+    results = asyncio.run(run())
+    assert len(results) == 3
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_result_count_mismatch_fails_every_waiter():
+    batch_fn, _ = make_recorder(lambda items: items[:-1])
+    
+    async def run():
+        batcher = MicroBatcher(batch_fn, max_wait_ms=1)
+        return await asyncio.wait_for(
+            asyncio.gather(*(batcher.submit(i) for i in range(3)), return_exceptions=True),
+            timeout=1
+        )
+    
+    results = asyncio.run(run())
+    assert len(results) == 3
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.mark.parametrize("cancel_after_dispatch", [False, True])
+def test_cancelled_submitter_does_not_break_batch(cancel_after_dispatch):
+    batch_fn, calls = make_recorder(delay=0.05)
+    
+    async def run():
+        batcher = MicroBatcher(batch_fn, max_batch_size=100, max_wait_ms=5)
+        tasks = [asyncio.create_task(batcher.submit(i)) for i in range(3)]
+        
+        # Cancel either while waiting for the timer or while batch_fn runs
+        await asyncio.sleep(0.02 if cancel_after_dispatch else 0)
+        tasks[1].cancel()
+        
+        return await asyncio.gather(*tasks, return_exceptions=True)
+    
+    first, second, third = asyncio.run(run())
+    assert (first, third) == (0, 4)
+    assert isinstance(second, asyncio.CancelledError)
+    assert calls == [[0, 1, 2]]
+
+
+def test_cancelled_batch_fn_releases_every_waiter():
+    def cancel(items):
+        raise asyncio.CancelledError()
+    
+    batch_fn, _ = make_recorder(cancel)
+    
+    async def run():
+        batcher = MicroBatcher(batch_fn, max_wait_ms=1)
+        return await asyncio.wait_for(
+            asyncio.gather(*(batcher.submit(i) for i in range(3)), return_exceptions=True),
+            timeout=1
+        )
+    
+    results = asyncio.run(run())
+    assert len(results) == 3
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
@@ -0,0 +1,60 @@
+"""Tests for the conversation and lead data models."""
+
+from datetime import datetime
+
+import pytest
+
+from src.models import ConversationContext, LeadCaptureInput, LeadData, Message
+
+
+def test_lead_data_json_round_trip():
+    lead = LeadData(email="creator@example.com", name="John Doe", plan_interest="Pro")
+    
+    restored = LeadData.model_validate_json(lead.model_dump_json())
+    
+    assert restored.email == lead.email
+    assert restored.timestamp == pytest.approx(lead.timestamp, abs=1e-6)
+
+
+def test_conversation_context_json_round_trip():
+    context = ConversationContext()
+    context.add_message("user", "Hi there")
+    context.add_message("assistant", "Hello! How can I help?")
+    
+    restored = ConversationContext.model_validate_json(context.model_dump_json())
+    
+    assert [m.content for m in restored.messages] == [m.content for m in context.messages]
+    for restored_msg, msg in zip(restored.messages, context.messages):
+        assert restored_msg.timestamp == pytest.approx(msg.timestamp, abs=1e-6)
+
+
+def test_timestamp_accepts_datetime_and_iso_string():
+    moment = datetime(2026, 1, 14, 10, 30)
+    
+    from_datetime = Message(role="user", content="hi", timestamp=moment)
+    from_string = Message(role="user", content="hi", timestamp=moment.isoformat())
+    
+    assert from_datetime.timestamp == moment.timestamp()
+    assert from_string.timestamp == moment.timestamp()
+
+
+def test_lead_capture_accepts_single_letter_platform():
+    lead = LeadCaptureInput(name="John Doe", email="john@example.com", platform="X")
+    
+    assert lead.platform == "X"
+
+
+def test_lead_capture_rejects_blank_platform():
+    with pytest.raises(ValueError):
+        LeadCaptureInput(name="John Doe", email="john@example.com", platform="   ")
+
+
+def test_lead_data_accepts_display_name_email():
+    lead = LeadData(email="John Doe <john@example.com>")
+    
+    assert lead.email == "john@example.com"
+
+
+def test_lead_data_rejects_email_without_at():
+    with pytest.raises(ValueError):
+        LeadData(email="john.example.com")
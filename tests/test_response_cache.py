@@ -0,0 +1,74 @@
+"""Tests for the semantic response cache."""
+
+import math
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+from src.services.response_cache import SemanticResponseCache
+
+
+def at_angle(cosine: float) -> list:
+    """Unit vector whose cosine similarity with [1, 0] is the given value."""
+    return [cosine, math.sqrt(1 - cosine ** 2)]
+
+
+EMPTY = SemanticResponseCache.history_key([])
+QUERY = "Which plan has 4K?"
+
+
+def test_lookup_is_scoped_by_history_key():
+    cache = SemanticResponseCache()
+    other = SemanticResponseCache.history_key([HumanMessage(content="hi"), AIMessage(content="Hello!")])
+    cache.store("s1", EMPTY, QUERY, [1.0, 0.0], "first-turn answer")
+    
+    assert cache.lookup("s1", EMPTY, QUERY, [1.0, 0.0]) == "first-turn answer"
+    assert cache.lookup("s1", other, QUERY, [1.0, 0.0]) is None
+
+
+def test_threshold_boundary():
+    cache = SemanticResponseCache(threshold=0.9)
+    cache.store("s1", EMPTY, QUERY, [2.0, 0.0], "answer")
+    
+    assert cache.lookup("s1", EMPTY, "Which plan includes 4K?", at_angle(0.91)) == "answer"
+    assert cache.lookup("s1", EMPTY, "Which plan includes 4K?", at_angle(0.89)) is None
+
+
+def test_best_match_wins():
+    cache = SemanticResponseCache(threshold=0.5)
+    cache.store("s1", EMPTY, "x", [1.0, 0.0], "x-axis")
+    cache.store("s1", EMPTY, "y", [0.0, 1.0], "y-axis")
+    
+    assert cache.lookup("s1", EMPTY, "z", at_angle(0.3)) == "y-axis"
+
+
+def test_exact_query_hits_across_sessions():
+    cache = SemanticResponseCache()
+    cache.store("s1", EMPTY, QUERY, [1.0, 0.0], "answer")
+    
+    assert cache.lookup("s2", EMPTY, "  which PLAN has 4K? ", [0.0, 1.0]) == "answer"
+
+
+def test_queries_differing_only_in_name_never_share_an_entry():
+    cache = SemanticResponseCache(threshold=0.5)
+    cache.store("s1", EMPTY, "I'm a YouTuber named Priya, which plan suits me?", [1.0, 0.0], "Hi Priya!")
+    
+    # Identical embedding, so only the session scoping keeps the entry private
+    assert cache.lookup("s2", EMPTY, "I'm a YouTuber named Rahul, which plan suits me?", [1.0, 0.0]) is None
+
+
+def test_oldest_entry_is_evicted():
+    cache = SemanticResponseCache(max_entries=2)
+    cache.store("s1", EMPTY, "first", [1.0, 0.0], "first")
+    cache.store("s1", EMPTY, "second", [0.0, 1.0], "second")
+    cache.store("s1", EMPTY, "third", [-1.0, 0.0], "third")
+    
+    assert cache.lookup("s1", EMPTY, "first", [1.0, 0.0]) is None
+    assert cache.lookup("s1", EMPTY, "second", [0.0, 1.0]) == "second"
+    assert cache.lookup("s1", EMPTY, "third", [-1.0, 0.0]) == "third"
+
+
+def test_empty_response_is_not_stored():
+    cache = SemanticResponseCache()
+    cache.store("s1", EMPTY, QUERY, [1.0, 0.0], "")
+    
+    assert cache.lookup("s1", EMPTY, QUERY, [1.0, 0.0]) is None
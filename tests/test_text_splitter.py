@@ -0,0 +1,44 @@
+"""Tests for the paragraph-based knowledge base splitter."""
+
+from src.services.text_splitter import ParagraphTextSplitter
+
+
+def make_splitter(chunk_size: int, chunk_overlap: int) -> ParagraphTextSplitter:
+    return ParagraphTextSplitter(chunk_size=chunk_size, chunk_overlap=chunk_overlap, length_function=len)
+
+
+def test_chunks_stay_within_chunk_size():
+    paragraphs = [("word " * n).strip() for n in (3, 12, 1, 7, 20, 5, 9)]
+    splitter = make_splitter(chunk_size=60, chunk_overlap=15)
+    
+    chunks = splitter.split_text("\n\n".join(paragraphs))
+    
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 60 for chunk in chunks)
+
+
+def test_overlap_is_carried_between_adjacent_paragraphs():
+    splitter = make_splitter(chunk_size=20, chunk_overlap=8)
+    
+    chunks = splitter.split_text("alpha one\n\nbeta\n\ngamma two")
+    
+    assert chunks == ["alpha one\n\nbeta", "beta\n\ngamma two"]
+
+
+def test_long_paragraph_uses_recursive_fallback():
+    words = [f"w{i}" for i in range(20)]
+    splitter = make_splitter(chunk_size=20, chunk_overlap=0)
+    
+    chunks = splitter.split_text("short intro\n\n" + " ".join(words))
+    
+    assert chunks[0] == "short intro"
+    assert len(chunks) > 2
+    assert all(len(chunk) <= 20 for chunk in chunks)
+    assert " ".join(chunks[1:]).split() == words
+
+
+def test_blank_runs_produce_no_empty_chunks():
+    splitter = make_splitter(chunk_size=5, chunk_overlap=0)
+    
+    assert splitter.split_text("one\n\n\n\n\ntwo\n\n   \n\nthree") == ["one", "two", "three"]
+    assert splitter.split_text("\n\n\n") == []